@@ -9,15 +9,20 @@ It will not be possible to align the device with the class, and there will be
 no readback into the device's alignment. This is intended for a future update.
 """
 import functools
+import itertools
 import logging
+import math
+import operator
+from collections import namedtuple
+from types import MappingProxyType
 from typing import Union
 
 import numpy as np
 from lightpath import LightpathState
 from ophyd.device import Component as Cpt
 from ophyd.device import FormattedComponent as FCpt
+from ophyd.device import required_for_connection
 from ophyd.signal import EpicsSignalRO
-from ophyd.sim import NullStatus
 from ophyd.status import wait as status_wait
 from pcdscalc import common, diffraction
 
@@ -35,78 +40,288 @@ from .utils import get_status_float, get_status_value, schedule_task
 
 logger = logging.getLogger(__name__)
 
+# Hutch-specific LODCM settings, picked from the hutch name in the PV prefix
+_HutchConfig = namedtuple('_HutchConfig',
+                          'name motor_prefix df_suffix foils')
 
-class H1N(InOutRecordPositioner):
+_HUTCH_CONFIGS = MappingProxyType({
+    # The df filter wheel motor is XPP:MON:MMS:27 vs HFX:MON:MMS:22
+    'XPP': _HutchConfig(name='XPP', motor_prefix='XPP', df_suffix='27',
+                        foils=('Mo', 'Zr', 'Zn', 'Cu', 'Ni', 'Fe', 'Ti')),
+    'XCS': _HutchConfig(name='XCS', motor_prefix='HFX', df_suffix='22',
+                        foils=('Mo', 'Zr', 'Ge', 'Cu', 'Ni', 'Fe', 'Ti')),
+})
+
+_UNKNOWN_HUTCH = _HutchConfig(name='', motor_prefix='', df_suffix='27',
+                              foils=())
+
+
+def _get_hutch_config(prefix):
+    """Get the `_HutchConfig` of the first hutch named in ``prefix``."""
+    for hutch, config in _HUTCH_CONFIGS.items():
+        if hutch in prefix:
+            return config
+    return _UNKNOWN_HUTCH
+
+
+@functools.lru_cache(maxsize=32)
+def _d_space(material, reflection):
+    """
+    Cached `pcdscalc.diffraction.d_space`.
+
+    There are only two materials and a handful of reflections, so there is no
+    need to redo the lattice calculation on every energy readback.
+    """
+    return diffraction.d_space(material, reflection)
+
+
+@functools.lru_cache(maxsize=256)
+def _lom_geometry(energy, material, reflection):
+    """
+    Cached `pcdscalc.diffraction.get_lom_geometry`.
+
+    ``energy`` is in eV. ``reflection`` must be a tuple so it can be hashed.
+    """
+    return diffraction.get_lom_geometry(energy, material, reflection)
+
+
+def _form(left_str, center_str, right_str):
+    """Lay out one row of the `LODCM` status table."""
+    return f'{left_str:<16}{center_str:>26}{right_str:>26}'
+
+
+def _motor_str(readback):
+    """Render a ``(units, user, dial)`` readback as ``user (dial)``."""
+    _, user, dial = readback
+    return f'{user} ({dial})'
+
+
+class _LODCMStatePositioner(InOutRecordPositioner):
+    """
+    `InOutRecordPositioner` with its inserted and removed states precomputed.
+
+    The in and out states of each subclass are validated against
+    ``states_list`` and resolved through ``_states_alias`` once, when the
+    class is made, so that `inserted` and `removed` only need to resolve the
+    current state instead of every state in the list.
+
+    Instances that end up with their own in or out states, e.g. from
+    ``_in_if_not_out`` or the hutch foils, get their sets redone in
+    `_state_init`.
+
+    Each subclass also gets its own copy of ``_states_alias``, as the first
+    `get_state` adds the PV enum strings to it.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._states_alias = dict(cls._states_alias)
+        cls._in_states_set = cls._canonical_states(cls.in_states)
+        cls._out_states_set = cls._canonical_states(cls.out_states)
+
+    @required_for_connection
+    def _state_init(self):
+        super()._state_init()
+        cls = type(self)
+        if self.in_states is not cls.in_states:
+            self._in_states_set = self._canonical_states(self.in_states,
+                                                         self.states_list)
+        if self.out_states is not cls.out_states:
+            self._out_states_set = self._canonical_states(self.out_states,
+                                                          self.states_list)
+
+    @classmethod
+    def _canonical_states(cls, states, states_list=None):
+        """Map ``states`` and their aliases to a set of ``states_list``."""
+        if states_list is None:
+            states_list = cls.states_list
+        alias_reverse = {}
+        for state, aliases in cls._states_alias.items():
+            if isinstance(aliases, str):
+                aliases = [aliases]
+            for alias in aliases:
+                alias_reverse[alias] = state
+        canonical = frozenset(alias_reverse.get(state, state)
+                              for state in states)
+        unknown = canonical.difference(states_list)
+        if unknown:
+            raise ValueError(
+                f'Bad states definition for {cls.__name__}! States '
+                f'{sorted(unknown)} are not in states_list {states_list}'
+            )
+        return canonical
+
+    def check_inserted(self, state=None):
+        """Query if a particular state counts as inserted."""
+        return self._get_state_name(state) in self._in_states_set
+
+    def check_removed(self, state=None):
+        """Query if a particular state counts as removed."""
+        return self._get_state_name(state) in self._out_states_set
+
+    def _get_state_name(self, state=None):
+        if state is None:
+            state = self.state.get()
+        return self.get_state(state).name
+
+
+class H1N(_LODCMStatePositioner):
     states_list = ['OUT', 'C', 'Si']
     in_states = ['C', 'Si']
     _states_alias = {'C': 'IN'}
     _transmission = {'C': 0.8, 'Si': 0.7}
 
 
-class YagLom(InOutRecordPositioner):
+class YagLom(_LODCMStatePositioner):
     states_list = ['OUT', 'YAG', 'SLIT1', 'SLIT2', 'SLIT3']
     in_states = ['YAG', 'SLIT1', 'SLIT2', 'SLIT3']
     _states_alias = {'YAG': 'IN'}
 
 
-class Dectris(InOutRecordPositioner):
+class Dectris(_LODCMStatePositioner):
     states_list = ['OUT', 'DECTRIS', 'SLIT1', 'SLIT2', 'SLIT3', 'OUTLOW']
     in_states = ['DECTRIS', 'SLIT1', 'SLIT2', 'SLIT3']
     out_states = ['OUT', 'OUTLOW']
     _states_alias = {'DECTRIS': 'IN'}
 
 
-class Diode(InOutRecordPositioner):
+class Diode(_LODCMStatePositioner):
     states_list = ['OUT', 'IN']
 
 
-class Foil(InOutRecordPositioner):
+class Foil(_LODCMStatePositioner):
+    """
+    LODCM diagnostics foil filters.
+
+    The available foils depend on the hutch. Use `XPPFoil` or `XCSFoil`
+    directly, otherwise the foils are picked from the hutch in the prefix.
+    """
     states_list = ['OUT']
     in_states = []
 
     def __init__(self, prefix, *args, **kwargs):
-        if 'XPP' in prefix:
-            self.in_states = ['Mo', 'Zr', 'Zn', 'Cu', 'Ni', 'Fe', 'Ti']
-        elif 'XCS' in prefix:
-            self.in_states = ['Mo', 'Zr', 'Ge', 'Cu', 'Ni', 'Fe', 'Ti']
-        self.states_list = ['OUT'] + self.in_states
+        if not self.in_states:
+            foils = _get_hutch_config(prefix).foils
+            if foils:
+                self.in_states = list(foils)
+                self.states_list = ['OUT'] + self.in_states
         super().__init__(prefix, *args, **kwargs)
 
 
-class CHI1(InOutRecordPositioner):
+class XPPFoil(Foil):
+    """LODCM diagnostics foil filters in XPP."""
+    in_states = list(_HUTCH_CONFIGS['XPP'].foils)
+    states_list = ['OUT'] + in_states
+
+
+class XCSFoil(Foil):
+    """LODCM diagnostics foil filters in XCS."""
+    in_states = list(_HUTCH_CONFIGS['XCS'].foils)
+    states_list = ['OUT'] + in_states
+
+
+class CHI1(_LODCMStatePositioner):
     """Rotation axis, it does not have an `OUT` state."""
     states_list = ['C', 'Si']
     in_states = ['C', 'Si']
     out_states = []
 
 
-class CHI2(InOutRecordPositioner):
+class CHI2(_LODCMStatePositioner):
     """Rotation axis, it does not have an `OUT` state."""
     states_list = ['C', 'Si']
     in_states = ['C', 'Si']
     out_states = []
 
 
-class H2N(InOutRecordPositioner):
+class H2N(_LODCMStatePositioner):
     states_list = ['C', 'Si']
     in_states = ['C', 'Si']
     out_states = []
 
 
-class Y1(InOutRecordPositioner):
+class Y1(_LODCMStatePositioner):
     """Vertical y motion. Does not have an `OUT` state."""
     states_list = ['C', 'Si']
     in_states = ['C', 'Si']
     out_states = []
 
 
-class Y2(InOutRecordPositioner):
+class Y2(_LODCMStatePositioner):
     states_list = ['C', 'Si']
     in_states = ['C', 'Si']
     out_states = []
 
 
-class CrystalTower1(BaseInterface, GroupDevice):
+class _CrystalTowerMixin:
+    """
+    Readback cache shared by `CrystalTower1` and `CrystalTower2`.
+
+    The material and reflection checks run on every status print and energy
+    calculation, so the last readbacks of the components in ``_cached_cpts``
+    are kept until the component reports a new value, a new connection
+    state or new metadata, instead of asking EPICS every time.
+    """
+    _cached_cpts = ()
+
+    def __init__(self, *args, **kwargs):
+        self._cpt_cache = {}
+        self._cpt_generation = {}
+        self._cpt_counter = itertools.count()
+        super().__init__(*args, **kwargs)
+        for attr in self._cached_cpts:
+            cpt = getattr(self, attr)
+            clear = functools.partial(self._clear_cached_value, attr)
+            if isinstance(cpt, InOutRecordPositioner):
+                cpt.subscribe(clear, run=False)
+                signal = cpt.state
+            else:
+                signal = cpt
+                signal.subscribe(clear, event_type=signal.SUB_VALUE,
+                                 run=False)
+            # connection changes are reported as metadata updates
+            signal.subscribe(clear, event_type=signal.SUB_META, run=False)
+
+    def _clear_cached_value(self, attr, *args, **kwargs):
+        """Forget the cached readback of a state or reflection component."""
+        self._cpt_generation[attr] = next(self._cpt_counter)
+        self._cpt_cache.pop(attr, None)
+
+    def _get_cached(self, attr):
+        """Get the state position or reflection value of a component."""
+        try:
+            return self._cpt_cache[attr]
+        except KeyError:
+            pass
+        generation = self._cpt_generation.get(attr)
+        cpt = getattr(self, attr)
+        if isinstance(cpt, InOutRecordPositioner):
+            value = cpt.position
+        else:
+            value = cpt.get()
+        self._cpt_cache[attr] = value
+        if self._cpt_generation.get(attr) != generation:
+            # the component updated during the read, the value may be stale
+            self._cpt_cache.pop(attr, None)
+        return value
+
+    def _get_configuration(self):
+        """
+        Get the ``(material, reflection)`` of the tower in one pass.
+
+        Raises
+        ------
+        ValueError
+            When the material could not be determined.
+        """
+        material = self.get_material()
+        if material == 'C':
+            attr = 'diamond_reflection'
+        else:
+            attr = 'silicon_reflection'
+        return material, tuple(self._get_cached(attr))
+
+
+class CrystalTower1(_CrystalTowerMixin, BaseInterface, GroupDevice):
     """
     LODCM Crystal Tower 1.
 
@@ -205,29 +420,36 @@ class CrystalTower1(BaseInterface, GroupDevice):
     tab_component_names = True
     tab_whitelist = ['is_diamond', 'is_silicon', 'get_reflection',
                      'get_material']
+    _cached_cpts = ('h1n_state', 'y1_state', 'chi1_state',
+                    'diamond_reflection', 'silicon_reflection')
 
     def __init__(self, prefix, *args, **kwargs):
-        self._hutch_prefix = ''
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
         self._prefix = prefix
-        if 'XPP' in prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in prefix:
-            self._hutch_prefix = 'HFX'
         super().__init__(prefix, *args, **kwargs)
 
+    def _tower_positions(self):
+        """
+        Get the ``(h1n, y1, chi1)`` state positions of the tower.
+
+        When h1n is `OUT` we are still aligned to the crystal selected by the
+        other axes, so h1n is reported as the y1 state in that case.
+        """
+        h1n = self._get_cached('h1n_state')
+        y1 = self._get_cached('y1_state')
+        if h1n == 'OUT':
+            h1n = y1
+        return (h1n, y1, self._get_cached('chi1_state'))
+
     def is_diamond(self):
         """Check if tower 1 is with Diamond (C) material."""
-        return ((self.h1n_state.position == 'C' or
-                 self.h1n_state.position == 'OUT') and
-                self.y1_state.position == 'C' and
-                self.chi1_state.position == 'C')
+        return self._tower_positions() == ('C', 'C', 'C')
 
     def is_silicon(self):
         """Check if tower 1 is with Silicon (Si) material."""
-        return ((self.h1n_state.position == 'Si' or
-                 self.h1n_state.position == 'OUT') and
-                self.y1_state.position == 'Si' and
-                self.chi1_state.position == 'Si')
+        return self._tower_positions() == ('Si', 'Si', 'Si')
 
     def get_reflection(self):
         """
@@ -246,9 +468,9 @@ class CrystalTower1(BaseInterface, GroupDevice):
         """
         reflection = None
         if self.is_diamond():
-            reflection = self.diamond_reflection.get()
+            reflection = self._get_cached('diamond_reflection')
         elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
+            reflection = self._get_cached('silicon_reflection')
 
         if reflection is not None:
             return tuple(reflection)
@@ -269,24 +491,18 @@ class CrystalTower1(BaseInterface, GroupDevice):
             When the material could not be determined or is something else
              other than `Si` or `C`.
         """
-        if self.is_diamond():
-            return 'C'
-        elif self.is_silicon():
-            return 'Si'
-        else:
-            raise ValueError(
-                "Unable to determine crystal material for Tower 1")
+        h1n, y1, chi1 = self._tower_positions()
+        if h1n == y1 == chi1 and h1n in ('C', 'Si'):
+            return h1n
+        raise ValueError(
+            "Unable to determine crystal material for Tower 1")
 
     def format_status_info(self, status_info):
         """Override status info handler to render the crystal tower 1."""
         t1_state = get_status_value(
             status_info, 'h1n_state', 'position')
         state = f'h1n_state: {t1_state}'
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        hutch = f'{self._hutch} ' if self._hutch else ''
 
         try:
             material = self.get_material()
@@ -368,7 +584,7 @@ hp [{hp_units}]  {hp_user} ({hp_dial})
 """
 
 
-class CrystalTower2(BaseInterface, GroupDevice):
+class CrystalTower2(_CrystalTowerMixin, BaseInterface, GroupDevice):
     """
     LODCM Crystal Tower 2.
 
@@ -459,27 +675,29 @@ class CrystalTower2(BaseInterface, GroupDevice):
     tab_component_names = True
     tab_whitelist = ['is_diamond', 'is_silicon', 'get_reflection',
                      'get_material']
+    _cached_cpts = ('h2n_state', 'y2_state', 'chi2_state',
+                    'diamond_reflection', 'silicon_reflection')
 
     def __init__(self, prefix, *args, **kwargs):
-        self._hutch_prefix = ''
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
         self._prefix = prefix
-        if 'XPP' in prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in prefix:
-            self._hutch_prefix = 'HFX'
         super().__init__(prefix, *args, **kwargs)
 
+    def _tower_positions(self):
+        """Get the ``(h2n, y2, chi2)`` state positions of the tower."""
+        return (self._get_cached('h2n_state'),
+                self._get_cached('y2_state'),
+                self._get_cached('chi2_state'))
+
     def is_diamond(self):
         """Check if tower 2 is with Diamond (C) material."""
-        return (self.h2n_state.position == 'C' and
-                self.y2_state.position == 'C' and
-                self.chi2_state.position == 'C')
+        return self._tower_positions() == ('C', 'C', 'C')
 
     def is_silicon(self):
         """Check if tower 2 is with Silicon (Si) material."""
-        return (self.h2n_state.position == 'Si' and
-                self.y2_state.position == 'Si' and
-                self.chi2_state.position == 'Si')
+        return self._tower_positions() == ('Si', 'Si', 'Si')
 
     def get_reflection(self):
         """
@@ -498,9 +716,9 @@ class CrystalTower2(BaseInterface, GroupDevice):
         """
         reflection = None
         if self.is_diamond():
-            reflection = self.diamond_reflection.get()
+            reflection = self._get_cached('diamond_reflection')
         elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
+            reflection = self._get_cached('silicon_reflection')
 
         if reflection is not None:
             return tuple(reflection)
@@ -521,24 +739,18 @@ class CrystalTower2(BaseInterface, GroupDevice):
             When the material could not be determined or is something else
              other than `Si` or `C`.
         """
-        if self.is_diamond():
-            return 'C'
-        elif self.is_silicon():
-            return 'Si'
-        else:
-            raise ValueError(
-                "Unable to determine crystal material for Tower 2")
+        h2n, y2, chi2 = self._tower_positions()
+        if h2n == y2 == chi2 and h2n in ('C', 'Si'):
+            return h2n
+        raise ValueError(
+            "Unable to determine crystal material for Tower 2")
 
     def format_status_info(self, status_info):
         """Override status info handler to render the crystal tower 2."""
         t2_state = get_status_value(
             status_info, 'h2n_state', 'position')
         state = f'h2n_state: {t2_state}'
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        hutch = f'{self._hutch} ' if self._hutch else ''
 
         try:
             material = self.get_material()
@@ -660,24 +872,16 @@ class DiagnosticsTower(BaseInterface, GroupDevice):
 
     def __init__(self, prefix, *args, **kwargs):
         # The df component has a different PV suffix in `XPP` vs `XCS`
-        # XPP:MON:MMS:27 vs HFX:MON:MMS:22
-        self._hutch_prefix = ''
-        self._df_suffix = '27'
-        if 'XPP' in prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in prefix:
-            self._hutch_prefix = 'HFX'
-            self._df_suffix = '22'
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
+        self._df_suffix = hutch.df_suffix
 
         super().__init__(prefix, *args, **kwargs)
 
     def format_status_info(self, status_info):
         """Override status info handler to render the diagnostics tower."""
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        hutch = f'{self._hutch} ' if self._hutch else ''
         # diagnostics
         dh_units = get_status_value(
             status_info, 'dh', 'user_setpoint', 'units')
@@ -775,11 +979,9 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
 
     def __init__(self, prefix, *args, **kwargs):
         self._prefix = prefix
-        self._hutch_prefix = ''
-        if 'XPP' in self._prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in self._prefix:
-            self._hutch_prefix = 'HFX'
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
 
         super().__init__(prefix=prefix, *args, **kwargs)
 
@@ -829,10 +1031,34 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
         """
         reflection = reflection or self.get_reflection()
         th = self.th1Si.wm()
-        length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
+        length = (2 * math.sin(math.radians(th)) *
+                  _d_space(material, tuple(reflection)))
         return common.wavelength_to_energy(length) / 1000
 
+    def get_both_tower_energies(self, material='Si', reflection=None):
+        """
+        Get photon energies from both towers in keV.
+
+        Both Bragg angles are converted in one array operation.
+
+        Parameters
+        ----------
+        material : str, optional
+            Chemical formula. E.g.: `Si`
+        reflection : tuple, optional
+            Reflection of material. E.g.: `(1, 1, 1)`
+
+        Returns
+        -------
+        e1, e2 : tuple
+            Photon energies of the first and second tower in keV.
+        """
+        reflection = reflection or self.get_reflection()
+        th = np.radians([self.th1Si.wm(), self.th2Si.wm()])
+        length = 2 * np.sin(th) * _d_space(material, tuple(reflection))
+        e1, e2 = common.wavelength_to_energy(length) / 1000
+        return e1, e2
+
     def calc_geometry(self, energy, material='Si', reflection=None):
         """
         Calculate the lom geometry.
@@ -850,7 +1076,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
+        th, z = _lom_geometry(energy*1e3, material, tuple(reflection))
         return (th, z)
 
     @pseudo_position_argument
@@ -904,8 +1130,8 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
         except Exception:
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
-        length = (2 * np.sin(np.deg2rad(real_pos.th1Si))
-                    * diffraction.d_space('Si', reflection))
+        length = (2 * math.sin(math.radians(real_pos.th1Si))
+                    * _d_space('Si', tuple(reflection)))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -915,11 +1141,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
 
     def format_status_info(self, status_info):
         """Override status info handler to render the energy si."""
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        hutch = f'{self._hutch} ' if self._hutch else ''
 
         try:
             material = self.get_material()
@@ -996,11 +1218,9 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
 
     def __init__(self, prefix, *args, **kwargs):
         self._prefix = prefix
-        self._hutch_prefix = ''
-        if 'XPP' in self._prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in self._prefix:
-            self._hutch_prefix = 'HFX'
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
 
         super().__init__(prefix=prefix, *args, **kwargs)
 
@@ -1050,10 +1270,34 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
         """
         reflection = reflection or self.get_reflection()
         th = self.th1C.wm()
-        length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
+        length = (2 * math.sin(math.radians(th)) *
+                  _d_space(material, tuple(reflection)))
         return common.wavelength_to_energy(length) / 1000
 
+    def get_both_tower_energies(self, material='C', reflection=None):
+        """
+        Get photon energies from both towers in keV.
+
+        Both Bragg angles are converted in one array operation.
+
+        Parameters
+        ----------
+        material : str, optional
+            Chemical formula. E.g.: `C`
+        reflection : tuple, optional
+            Reflection of material. E.g.: `(1, 1, 1)`
+
+        Returns
+        -------
+        e1, e2 : tuple
+            Photon energies of the first and second tower in keV.
+        """
+        reflection = reflection or self.get_reflection()
+        th = np.radians([self.th1C.wm(), self.th2C.wm()])
+        length = 2 * np.sin(th) * _d_space(material, tuple(reflection))
+        e1, e2 = common.wavelength_to_energy(length) / 1000
+        return e1, e2
+
     def calc_geometry(self, energy, material='C', reflection=None):
         """
         Calculate the lom geometry.
@@ -1071,7 +1315,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
+        th, z = _lom_geometry(energy*1e3, material, tuple(reflection))
         return (th, z)
 
     @pseudo_position_argument
@@ -1124,8 +1368,8 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
         except Exception:
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
-        length = (2 * np.sin(np.deg2rad(real_pos.th1C))
-                    * diffraction.d_space('C', reflection))
+        length = (2 * math.sin(math.radians(real_pos.th1C))
+                    * _d_space('C', tuple(reflection)))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1135,11 +1379,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
 
     def format_status_info(self, status_info):
         """Override status info handler to render the energy c."""
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        hutch = f'{self._hutch} ' if self._hutch else ''
 
         try:
             material = self.get_material()
@@ -1222,78 +1462,53 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
 
     lightpath_cpts = ['tower1.h1n_state.state']
 
+    # Shortcuts to the sub-device components, {parent: (attr, ...)}
+    _component_aliases = {
+        'tower1': ('z1', 'x1', 'y1', 'th1', 'chi1', 'h1n', 'h1p',
+                   'h1n_state', 'y1_state', 'chi1_state',
+                   'x1C', 'x1Si', 'y1C', 'y1Si', 'chi1C', 'chi1Si',
+                   'h1nC', 'h1nSi', 'h1pC', 'h1pSi'),
+        'tower2': ('z2', 'x2', 'y2', 'th2', 'chi2', 'h2n', 'diode2',
+                   'h2n_state', 'y2_state', 'chi2_state',
+                   'x2C', 'x2Si', 'y2C', 'y2Si', 'chi2C', 'chi2Si',
+                   'h2nC', 'h2nSi'),
+        'diag_tower': ('dh', 'dv', 'dr', 'df', 'dd', 'yag_zoom'),
+        'energy_si': ('th1Si', 'z1Si', 'th2Si', 'z2Si'),
+        'energy_c': ('th1C', 'z1C', 'th2C', 'z2C'),
+    }
+
+    # Beamline attributes reached for each h1n state, before the diagnostics
+    _h1n_destinations = {
+        'OUT': ('main_line',),
+        'Si': ('mono_line',),
+        'C': ('main_line', 'mono_line'),
+    }
+
     def __init__(self, prefix, *, name, main_line='MAIN', mono_line='MONO',
                  **kwargs):
         self._prefix = prefix
-        self._hutch_prefix = ''
-        if 'XPP' in self._prefix:
-            self._hutch_prefix = 'XPP'
-        elif 'XCS' in self._prefix:
-            self._hutch_prefix = 'HFX'
+        hutch = _get_hutch_config(prefix)
+        self._hutch = hutch.name
+        self._hutch_prefix = hutch.motor_prefix
 
         super().__init__(prefix, name=name, **kwargs)
         self.main_line = main_line
         self.mono_line = mono_line
-        # first tower
-        self.z1 = self.tower1.z1
-        self.x1 = self.tower1.x1
-        self.y1 = self.tower1.y1
-        self.th1 = self.tower1.th1
-        self.chi1 = self.tower1.chi1
-        self.h1n = self.tower1.h1n
-        self.h1p = self.tower1.h1p
-        # second tower
-        self.z2 = self.tower2.z2
-        self.x2 = self.tower2.x2
-        self.y2 = self.tower2.y2
-        self.th2 = self.tower2.th2
-        self.chi2 = self.tower2.chi2
-        self.h2n = self.tower2.h2n
-        self.diode2 = self.tower2.diode2
-        # diagnostic tower
-        self.dh = self.diag_tower.dh
-        self.dv = self.diag_tower.dv
-        self.dr = self.diag_tower.dr
-        self.df = self.diag_tower.df
-        self.dd = self.diag_tower.dd
-        self.yag_zoom = self.diag_tower.yag_zoom
-        # states
-        self.h1n_state = self.tower1.h1n_state
-        self.y1_state = self.tower1.y1_state
-        self.chi1_state = self.tower1.chi1_state
-        self.h2n_state = self.tower2.h2n_state
-        self.y2_state = self.tower2.y2_state
-        self.chi2_state = self.tower2.chi2_state
-        # # offset positioners - tower 1
-        self.th1Si = self.energy_si.th1Si
-        self.z1Si = self.energy_si.z1Si
-        self.th1C = self.energy_c.th1C
-        self.z1C = self.energy_c.z1C
-
-        self.x1C = self.tower1.x1C
-        self.x1Si = self.tower1.x1Si
-        self.y1C = self.tower1.y1C
-        self.y1Si = self.tower1.y1Si
-        self.chi1C = self.tower1.chi1C
-        self.chi1Si = self.tower1.chi1Si
-        self.h1nC = self.tower1.h1nC
-        self.h1nSi = self.tower1.h1nSi
-        self.h1pC = self.tower1.h1pC
-        self.h1pSi = self.tower1.h1pSi
-        # # offset positioners - tower 2
-        self.th2Si = self.energy_si.th2Si
-        self.z2Si = self.energy_si.z2Si
-        self.th2C = self.energy_c.th2C
-        self.z2C = self.energy_c.z2C
-
-        self.x2C = self.tower2.x2C
-        self.x2Si = self.tower2.x2Si
-        self.y2C = self.tower2.y2C
-        self.y2Si = self.tower2.y2Si
-        self.chi2C = self.tower2.chi2C
-        self.chi2Si = self.tower2.chi2Si
-        self.h2nC = self.tower2.h2nC
-        self.h2nSi = self.tower2.h2nSi
+        for parent, attrs in self._component_aliases.items():
+            device = getattr(self, parent)
+            for attr in attrs:
+                setattr(self, attr, getattr(device, attr))
+        # the destination only changes when one of these states does, it is
+        # kept as the names of the line attributes and worked out on first
+        # access, or again after an update that could not be resolved
+        self._destination_lines = None
+        self._destination_generation = None
+        self._destination_counter = itertools.count()
+        for state in (self.h1n_state, self.yag, self.dectris, self.foil):
+            state.subscribe(self._update_destination, run=False)
+            # connection changes are reported as metadata updates
+            state.state.subscribe(self._clear_destination,
+                                  event_type=state.state.SUB_META, run=False)
 
     @property
     def energy(self):
@@ -1347,7 +1562,9 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         """
         Which beamline the light is reaching.
 
-        Indeterminate states will show as blocked.
+        Indeterminate states will show as blocked. This is worked out on the
+        first access and then updated from the h1n and diagnostics state
+        subscriptions rather than on every access.
 
         Returns
         -------
@@ -1355,20 +1572,57 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
             `.main_line` if the light continues on the main line.
             `.mono_line` if the light continues on the mono line.
         """
+        lines = self._destination_lines
+        if lines is None:
+            lines = self._update_destination() or ()
+        return [getattr(self, line) for line in lines]
 
-        if self.h1n_state.position == 'OUT':
-            dest = [self.main_line]
-        elif self.h1n_state.position == 'Si':
-            dest = [self.mono_line]
-        elif self.h1n_state.position == 'C':
-            dest = [self.main_line, self.mono_line]
-        else:
-            dest = []
+    def _clear_destination(self, *args, **kwargs):
+        """Callback to forget the destination when a state reconnects."""
+        self._destination_generation = next(self._destination_counter)
+        self._destination_lines = None
+
+    def _update_destination(self, *args, **kwargs):
+        """
+        Callback to recompute the destination when a state changes.
+
+        The result is only kept if no other update or clear ran while it was
+        being worked out, as it may be stale otherwise.
 
-        if not self._dia_clear and self.mono_line in dest:
-            dest.remove(self.mono_line)
+        Returns
+        -------
+        lines : tuple of str or None
+            See `_calc_destination`, `None` if it could not be determined.
+        """
+        generation = next(self._destination_counter)
+        self._destination_generation = generation
+        try:
+            lines = self._calc_destination()
+        except Exception:
+            self.log.debug('Unable to determine the destination of %s',
+                           self.name, exc_info=True)
+            lines = None
+        if self._destination_generation == generation:
+            self._destination_lines = lines
+            if self._destination_generation != generation:
+                # a newer update came in while storing
+                self._destination_lines = None
+        return lines
+
+    def _calc_destination(self):
+        """
+        Determine the destination from the current h1n and dia states.
 
-        return dest
+        Returns
+        -------
+        lines : tuple of str
+            The names of the line attributes the light reaches, so that
+            reassigning `.main_line` or `.mono_line` is picked up right away.
+        """
+        lines = self._h1n_destinations.get(self.h1n_state.position, ())
+        if 'mono_line' in lines and not self._dia_clear:
+            lines = tuple(line for line in lines if line != 'mono_line')
+        return lines
 
     @property
     def _dia_clear(self):
@@ -1380,18 +1634,15 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         diag_clear : bool
             :keyword:`False` if the diagnostics will prevent beam.
         """
-
-        yag_clear = self.yag.removed
-        dectris_clear = self.dectris.removed
-        foil_clear = self.foil.removed
-        return all((yag_clear, dectris_clear, foil_clear))
+        # stop at the first blocking diagnostic
+        return all(dia.removed for dia in (self.yag, self.dectris, self.foil))
 
     def remove_dia(self, moved_cb=None, timeout=None, wait=False):
         """Remove all diagnostic components."""
         logger.debug('Removing %s diagnostics', self.name)
-        status = NullStatus()
-        for dia in (self.yag, self.dectris, self.diode, self.foil):
-            status = status & dia.remove(timeout=timeout, wait=False)
+        statuses = [dia.remove(timeout=timeout, wait=False)
+                    for dia in (self.yag, self.dectris, self.diode, self.foil)]
+        status = functools.reduce(operator.and_, statuses)
 
         if moved_cb is not None:
             status.add_callback(functools.partial(moved_cb, obj=self))
@@ -1451,6 +1702,27 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
             raise ValueError('Invalid Crystal Arrangement.')
         return m_1
 
+    def _get_configuration(self):
+        """
+        Get the crystals ``(material, reflection)`` in one pass.
+
+        Each tower state is only resolved once, where `get_material` and
+        `get_reflection` would each resolve the states of both towers.
+
+        Raises
+        ------
+        ValueError
+            When the material or reflection of the towers do not match, or
+            could not be determined.
+        """
+        config_1 = self.tower1._get_configuration()
+        config_2 = self.tower2._get_configuration()
+        if config_1 != config_2:
+            logger.warning('Crystals do not match: c1: %s, c2: %s',
+                           config_1, config_2)
+            raise ValueError('Invalid Crystal Arrangement.')
+        return config_1
+
     def get_energy(self, material=None, reflection=None):
         """
         Get photon energy from first tower in keV.
@@ -1472,9 +1744,37 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         material = material or self.get_material()
         reflection = reflection or self.get_reflection()
         if material == 'Si':
-            return self.energy_si.get_energy()
+            return self.energy_si.get_energy(reflection=reflection)
         elif material == 'C':
-            return self.energy_c.get_energy()
+            return self.energy_c.get_energy(reflection=reflection)
+        else:
+            raise ValueError('Cannot decide the energy motor because could not'
+                             ' determine the material.')
+
+    def get_both_tower_energies(self, material=None, reflection=None):
+        """
+        Get photon energies from both towers in keV.
+
+        Parameters
+        ----------
+        material : str, optional
+            Chemical formula.
+        reflection : tuple, optional
+            Reflection of material. E.g.: `(1, 1, 1)`
+
+        Returns
+        -------
+        e1, e2 : tuple
+            Photon energies of the first and second tower in keV.
+        """
+        material = material or self.get_material()
+        reflection = reflection or self.get_reflection()
+        if material == 'Si':
+            return self.energy_si.get_both_tower_energies(
+                material, reflection)
+        elif material == 'C':
+            return self.energy_c.get_both_tower_energies(
+                material, reflection)
         else:
             raise ValueError('Cannot decide the energy motor because could not'
                              ' determine the material.')
@@ -1515,8 +1815,7 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         # try to determine the material and reflection:
         material = material or self.get_material()
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy * 1e3, material,
-                                             reflection)
+        th, z = _lom_geometry(energy * 1e3, material, tuple(reflection))
         if material == 'Si':
             self.th1Si.set_current_position(th)
             self.th2Si.set_current_position(th)
@@ -1613,26 +1912,68 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         self.z1.wait(timeout=timeout)
         self.z2.wait(timeout=timeout)
 
+    def _status_motor_readbacks(self, status_info):
+        """
+        Format the motor readbacks used by the status printout.
+
+        Only the `status_info` snapshot is used, no PVs are read here. It is
+        walked once per motor rather than once per motor field.
+
+        Parameters
+        ----------
+        status_info : dict
+            See `status_info`.
+
+        Returns
+        -------
+        motors : dict
+            Mapping of motor attribute name to a ``(units, user, dial)``
+            tuple. Missing motors and fields are shown as ``N/A``.
+        """
+        motors = {}
+        for tower, names in (
+            ('tower1', ('z1', 'x1', 'th1', 'chi1', 'y1', 'h1n', 'h1p',
+                        'diode')),
+            ('tower2', ('z2', 'x2', 'th2', 'chi2', 'y2', 'h2n', 'h2p',
+                        'diode2')),
+            ('diag_tower', ('dh', 'dv', 'dr', 'df', 'dd', 'yag_zoom')),
+        ):
+            for name in names:
+                info = get_status_value(status_info, tower, name,
+                                        default_value={})
+                precision = 0 if name == 'yag_zoom' else 4
+                motors[name] = (
+                    get_status_value(info, 'user_setpoint', 'units'),
+                    get_status_float(info, 'position', precision=precision),
+                    get_status_float(info, 'dial_position', 'value',
+                                     precision=precision),
+                )
+        return motors
+
     def format_status_info(self, status_info):
         """Override status info handler to render the lodcm."""
+        motors = self._status_motor_readbacks(status_info)
         t1_state = get_status_value(
             status_info, 'tower1', 'h1n_state', 'position')
         t2_state = get_status_value(
             status_info, 'tower2', 'h2n_state', 'position')
+        hutch = f'{self._hutch} ' if self._hutch else ''
         state = ''
-        hutch = ''
-        if 'XPP' in self.prefix:
-            hutch = 'XPP '
+        if self._hutch == 'XPP':
             state = f'Crystal 1 state: {t1_state}'
-        elif 'XCS' in self.prefix:
-            hutch = 'XCS '
+        elif self._hutch == 'XCS':
             state = f'Crystal 1 state: {t1_state}'
             state = f'{state}\nCrystal 2 state: {t2_state}'
 
         try:
-            material = self.get_material()
+            material, reflection = self._get_configuration()
         except Exception:
-            material = 'Unknown'
+            # the reflections may not match while the materials still do
+            reflection = None
+            try:
+                material = self.get_material()
+            except Exception:
+                material = None
 
         if material == 'C':
             configuration = 'Diamond'
@@ -1641,158 +1982,47 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         else:
             configuration = 'Unknown'
 
-        try:
-            energy = self.get_energy()
-            energy = f"{energy:.4f}"
-        except Exception:
+        if reflection is None:
+            # without a crystal configuration there is no energy to compute
             energy = 'Unknown'
-
-        try:
-            ref = self.get_reflection()
-            ref = ''.join(map(str, ref))
-        except Exception:
+        else:
+            try:
+                energy = self.get_energy(material, reflection)
+                energy = f"{energy:.4f}"
+            except Exception:
+                # the configuration is known but the theta motor is not
+                energy = 'Unknown'
+
+        if reflection is None:
             ref = 'Unknown'
-        # tower 1
-        z_units = get_status_value(
-            status_info, 'tower1', 'z1', 'user_setpoint', 'units')
-        z_user = get_status_float(
-            status_info, 'tower1', 'z1', 'position')
-        z_dial = get_status_float(
-            status_info, 'tower1', 'z1', 'dial_position', 'value')
-
-        x_units = get_status_value(
-            status_info, 'tower1', 'x1', 'user_setpoint', 'units')
-        x_user = get_status_float(status_info, 'tower1', 'x1', 'position')
-        x_dial = get_status_float(
-            status_info, 'tower1', 'x1', 'dial_position', 'value')
-
-        th_units = get_status_value(
-            status_info, 'tower1', 'th1', 'user_setpoint', 'units')
-        th_user = get_status_float(
-            status_info, 'tower1', 'th1', 'position')
-        th_dial = get_status_float(
-            status_info, 'tower1', 'th1', 'dial_position', 'value')
-
-        chi_units = get_status_value(
-            status_info, 'tower1', 'chi1', 'user_setpoint', 'units')
-        chi_user = get_status_float(
-            status_info, 'tower1', 'chi1', 'position')
-        chi_dial = get_status_float(
-            status_info, 'tower1', 'chi1', 'dial_position', 'value')
-
-        y_units = get_status_value(
-            status_info, 'tower1', 'y1', 'user_setpoint', 'units')
-        y_user = get_status_float(
-            status_info, 'tower1', 'y1', 'position')
-        y_dial = get_status_float(
-            status_info, 'tower1', 'y1', 'dial_position', 'value')
-
-        hn_units = get_status_value(
-            status_info, 'tower1', 'h1n', 'user_setpoint', 'units')
-        hn_user = get_status_float(
-            status_info, 'tower1', 'h1n', 'position')
-        hn_dial = get_status_float(
-            status_info, 'tower1', 'h1n', 'dial_position', 'value')
-
-        hp_units = get_status_value(
-            status_info, 'tower1', 'h1p', 'user_setpoint', 'units')
-        hp_user = get_status_float(
-            status_info, 'tower1', 'h1p', 'position')
-        hp_dial = get_status_float(
-            status_info, 'tower1', 'h1p', 'dial_position', 'value')
-
-        diode_units = get_status_value(
-            status_info, 'tower1', 'diode2', 'user_setpoint', 'units')
-        diode_user = get_status_float(
-            status_info, 'tower1', 'diode', 'position')
-        diode_dial = get_status_float(
-            status_info, 'tower1', 'diode', 'dial_position', 'value')
-        # tower 2
-        z2_user = get_status_float(
-            status_info, 'tower2', 'z2', 'position')
-        z2_dial = get_status_float(
-            status_info, 'tower2', 'z2', 'dial_position', 'value')
-
-        x2_user = get_status_float(
-            status_info, 'tower2', 'x2', 'position')
-        x2_dial = get_status_float(
-            status_info, 'tower2', 'x2', 'dial_position', 'value')
-
-        th2_user = get_status_float(
-            status_info, 'tower2', 'th2', 'position')
-        th2_dial = get_status_float(
-            status_info, 'tower2', 'th2', 'dial_position', 'value')
-
-        chi2_user = get_status_float(
-            status_info, 'tower2', 'chi2', 'position')
-        chi2_dial = get_status_float(
-            status_info, 'tower2', 'chi2', 'dial_position', 'value')
-
-        y2_user = get_status_float(
-            status_info, 'tower2', 'y2', 'position')
-        y2_dial = get_status_float(
-            status_info, 'tower2', 'y2', 'dial_position', 'value')
-
-        hn2_user = get_status_float(
-            status_info, 'tower2', 'h2n', 'position')
-        hn2_dial = get_status_float(
-            status_info, 'tower2', 'h2n', 'dial_position', 'value')
-
-        hp2_user = get_status_float(
-            status_info, 'tower2', 'h2p', 'position')
-        hp2_dial = get_status_float(
-            status_info, 'tower2', 'h2p', 'dial_position', 'value')
-
-        diode2_user = get_status_float(
-            status_info, 'tower2', 'diode2', 'position')
-        diode2_dial = get_status_float(
-            status_info, 'tower2', 'diode2', 'dial_position', 'value')
-        # diagnostics
-        dh_units = get_status_value(
-            status_info, 'diag_tower', 'dh', 'user_setpoint', 'units')
-        dh_user = get_status_float(
-            status_info, 'diag_tower', 'dh', 'position')
-        dh_dial = get_status_float(
-            status_info, 'diag_tower', 'dh', 'dial_position', 'value')
-
-        dv_units = get_status_value(
-            status_info, 'diag_tower', 'dv', 'user_setpoint', 'units')
-        dv_user = get_status_float(
-            status_info, 'diag_tower', 'dv', 'position')
-        dv_dial = get_status_float(
-            status_info, 'diag_tower', 'dv', 'dial_position', 'value')
-
-        dr_units = get_status_value(
-            status_info, 'diag_tower', 'dr', 'user_setpoint', 'units')
-        dr_user = get_status_float(
-            status_info, 'diag_tower', 'dr', 'position')
-        dr_dial = get_status_float(
-            status_info, 'diag_tower', 'dr', 'dial_position', 'value')
-
-        df_units = get_status_value(
-            status_info, 'diag_tower', 'df', 'user_setpoint', 'units')
-        df_user = get_status_float(
-            status_info, 'diag_tower', 'df', 'position')
-        df_dial = get_status_float(
-            status_info, 'diag_tower', 'df', 'dial_position', 'value')
-
-        dd_units = get_status_value(
-            status_info, 'diag_tower', 'dd', 'user_setpoint', 'units')
-        dd_user = get_status_float(
-            status_info, 'diag_tower', 'dd', 'position')
-        dd_dial = get_status_float(
-            status_info, 'diag_tower', 'dd', 'dial_position', 'value')
-
-        yag_zoom_units = get_status_value(status_info, 'diag_tower',
-                                          'yag_zoom', 'user_setpoint', 'units')
-        yag_zoom_user = get_status_float(status_info, 'diag_tower',
-                                         'yag_zoom', 'position', precision=0)
-        yag_zoom_dial = get_status_float(status_info, 'diag_tower',
-                                         'yag_zoom', 'dial_position', 'value',
-                                         precision=0)
-
-        def form(left_str, center_str, right_str):
-            return f'{left_str:<16}{center_str:>26}{right_str:>26}'
+        else:
+            ref = ''.join(map(str, reflection))
+
+        towers = '\n'.join(
+            _form(f'{label} [{motors[first][0]}]', _motor_str(motors[first]),
+                  _motor_str(motors[second]))
+            for label, first, second in (
+                ('z', 'z1', 'z2'),
+                ('x', 'x1', 'x2'),
+                ('th', 'th1', 'th2'),
+                ('chi', 'chi1', 'chi2'),
+                ('y', 'y1', 'y2'),
+                ('hn', 'h1n', 'h2n'),
+                ('hp', 'h1p', 'h2p'),
+                ('diode', 'diode', 'diode2'),
+            )
+        )
+        diagnostics = '\n'.join(
+            _form(f'{label} [{motors[name][0]}]', _motor_str(motors[name]), '')
+            for label, name in (
+                ('diag r', 'dr'),
+                ('diag h', 'dh'),
+                ('diag v', 'dv'),
+                ('filter', 'df'),
+                ('diode', 'dd'),
+                ('navitar zoom', 'yag_zoom'),
+            )
+        )
 
         return f"""\
 {hutch}LODCM Motor Status Positions
@@ -1800,32 +2030,11 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
 Current Configuration: {configuration} ({ref})
 Photon Energy: {energy} [keV]
 -----------------------------------------------------------------
-{form(' ', 'Crystal Tower 1', 'Crystal Tower 2')}
-{form(f'z [{z_units}]', f'{z_user} ({z_dial})',
-      f'{z2_user} ({z2_dial})')}
-{form(f'x [{x_units}]', f'{x_user} ({x_dial})',
-      f'{x2_user} ({x2_dial})')}
-{form(f'th [{th_units}]', f'{th_user} ({th_dial})',
-      f'{th2_user} ({th2_dial})')}
-{form(f'chi [{chi_units}]', f'{chi_user} ({chi_dial})',
-      f'{chi2_user} ({chi2_dial})')}
-{form(f'y [{y_units}]', f'{y_user} ({y_dial})',
-      f'{y2_user} ({y2_dial})')}
-{form(f'hn [{hn_units}]', f'{hn_user} ({hn_dial})',
-      f'{hn2_user} ({hn2_dial})')}
-{form(f'hp [{hp_units}]', f'{hp_user} ({hp_dial})',
-      f'{hp2_user} ({hp2_dial})')}
-{form(f'diode [{diode_units}]', f'{diode_user} ({diode_dial})',
-      f'{diode2_user} ({diode2_dial})')}
+{_form(' ', 'Crystal Tower 1', 'Crystal Tower 2')}
+{towers}
 -----------------------------------------------------------------
-{form(' ', 'Diagnostic Tower', ' ')}
-{form(f'diag r [{dr_units}]', f'{dr_user} ({dr_dial})', '')}
-{form(f'diag h [{dh_units}]', f'{dh_user} ({dh_dial})', '')}
-{form(f'diag v [{dv_units}]', f'{dv_user} ({dv_dial})', '')}
-{form(f'filter [{df_units}]', f'{df_user} ({df_dial})', '')}
-{form(f'diode [{dd_units}]', f'{dd_user} ({dd_dial})', '')}
-{form(f'navitar zoom [{yag_zoom_units}]',
-      f'{yag_zoom_user} ({yag_zoom_dial})', '')}
+{_form(' ', 'Diagnostic Tower', ' ')}
+{diagnostics}
 """
 
 
@@ -1842,6 +2051,8 @@ class XCSLODCM(LODCM):
     """
     __doc__ += LODCM.__doc__
 
+    foil = Cpt(XCSFoil, ":FOIL", kind='omitted')
+
     def calc_lightpath_state(
         self,
         tower1_h1n_state_state: Union[int, str]
@@ -1913,6 +2124,8 @@ class XPPLODCM(LODCM):
     """
     __doc__ += LODCM.__doc__
 
+    foil = Cpt(XPPFoil, ":FOIL", kind='omitted')
+
     def calc_lightpath_state(
         self,
         tower1_h1n_state_state: Union[int, str]
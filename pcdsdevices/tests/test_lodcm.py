@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import numpy as np
 import pytest
@@ -8,7 +8,7 @@ from ophyd.sim import make_fake_device
 from ..epics_motor import OffsetMotor
 from ..lodcm import (CHI1, CHI2, H1N, H2N, LODCM, Y1, Y2, Dectris, Diode, Foil,
                      LODCMEnergyC, LODCMEnergySi, SimFirstTower, SimLODCM,
-                     SimSecondTower, YagLom)
+                     SimSecondTower, XCSFoil, XPPFoil, YagLom)
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +214,76 @@ def test_lodcm_destination(fake_lodcm):
     assert len(lodcm.destination) == 0
 
 
+def test_lodcm_destination_cached(fake_lodcm):
+    lodcm = fake_lodcm
+    lodcm.h1n_state.move('C')
+    with patch('pcdsdevices.lodcm.H1N.position',
+               new_callable=PropertyMock) as position:
+        assert lodcm.destination == [lodcm.main_line, lodcm.mono_line]
+        assert not position.called
+    # the cache is updated by the state subscriptions
+    lodcm.yag.move('IN')
+    assert lodcm.destination == [lodcm.main_line]
+    # the line names are looked up on access
+    lodcm.main_line = 'OTHER'
+    assert lodcm.destination == ['OTHER']
+
+
+def test_lodcm_destination_update_during_read(fake_lodcm):
+    lodcm = fake_lodcm
+    lodcm.h1n_state.move('OUT')
+    lodcm._clear_destination()
+    calc = lodcm._calc_destination
+    moved = []
+
+    def calc_then_move():
+        lines = calc()
+        if not moved:
+            moved.append(True)
+            lodcm.h1n_state.move('C')
+        return lines
+
+    # the read that was overtaken by the update does not replace it
+    with patch.object(lodcm, '_calc_destination', calc_then_move):
+        lodcm.destination
+    assert lodcm.destination == [lodcm.main_line, lodcm.mono_line]
+
+
+def test_lodcm_destination_disconnect(fake_lodcm):
+    lodcm = fake_lodcm
+    lodcm.h1n_state.move('OUT')
+    assert lodcm.destination == [lodcm.main_line]
+    # connection changes come in as metadata updates
+    signal = lodcm.h1n_state.state
+    signal._run_subs(sub_type=signal.SUB_META, connected=False)
+    assert lodcm._destination_lines is None
+
+
+def test_lodcm_destination_initial():
+    FakeLODCM = make_fake_device(SimLODCM)
+    # set up the states without any update reaching the destination
+    with patch('pcdsdevices.lodcm.LODCM._update_destination'):
+        lodcm = FakeLODCM('FAKE:LOM', name='fake_lom')
+        for state, cls in ((lodcm.h1n_state, H1N), (lodcm.yag, YagLom),
+                           (lodcm.dectris, Dectris), (lodcm.foil, Foil)):
+            state.state.sim_put(1)
+            state.state.sim_set_enum_strs(['Unknown'] + cls.states_list)
+    assert lodcm.destination == [lodcm.main_line]
+
+
+def test_lodcm_status(fake_lodcm):
+    lodcm = fake_lodcm
+    motors = lodcm._status_motor_readbacks(lodcm.status_info())
+    assert motors['z1'] == ('N/A', '0.0000', 'N/A')
+    assert motors['yag_zoom'] == ('N/A', '0', 'N/A')
+    # tower 1 has no diode
+    assert motors['diode'] == ('N/A', 'N/A', 'N/A')
+    status = lodcm.status()
+    assert 'Current Configuration: Diamond (111)' in status
+    assert 'Crystal Tower 1' in status
+    assert 'Diagnostic Tower' in status
+
+
 def test_lodcm_branches(fake_lodcm):
     logger.debug('test_lodcm_branches')
     lodcm = fake_lodcm
@@ -237,6 +307,35 @@ def test_hutch_foils():
     FakeFoil = make_fake_device(Foil)
     assert 'Zn' in FakeFoil('XPP', name='foil').in_states
     assert 'Ge' in FakeFoil('XCS', name='foil').in_states
+    assert FakeFoil('TST', name='foil').in_states == []
+    assert 'Zn' in make_fake_device(XPPFoil)('TST', name='foil').in_states
+    assert 'Ge' in make_fake_device(XCSFoil)('TST', name='foil').in_states
+    # the class-level states are left alone
+    assert Foil.states_list == ['OUT']
+    assert Foil.in_states == []
+
+
+def test_state_membership(fake_lodcm):
+    h1n = fake_lodcm.h1n_state
+    assert H1N._in_states_set == {'C', 'Si'}
+    assert h1n.removed and not h1n.inserted
+    h1n.move('IN')
+    assert h1n.inserted and not h1n.removed
+    assert h1n.check_removed('OUT')
+    assert h1n.check_inserted('Si')
+    FakeFoil = make_fake_device(Foil)
+    foil = FakeFoil('XPP', name='foil')
+    foil.state.sim_set_enum_strs(['Unknown', 'OUT'] + foil.in_states)
+    foil.move('Zn')
+    assert foil.inserted
+    # in_states set on the instance, aliases included, are picked up
+    h1n.in_states = ['IN']
+    h1n._state_init()
+    assert h1n.check_inserted('C')
+    assert not h1n.check_inserted('Si')
+    with pytest.raises(ValueError):
+        class BadStates(H1N):
+            in_states = ['C', 'Ge']
 
 
 def test_move_energy(fake_lodcm):
@@ -339,6 +438,41 @@ def test_tower2_crystal_type(fake_tower2):
         tower2.get_material()
 
 
+def test_tower1_state_cache(fake_tower1):
+    tower1 = fake_tower1
+    assert tower1.get_material() == 'C'
+    # cached readbacks are reused until the state updates
+    with patch('pcdsdevices.lodcm.Y1.position',
+               new_callable=PropertyMock) as position:
+        assert tower1.get_material() == 'C'
+        assert tower1.get_reflection() == (1, 1, 1)
+        assert not position.called
+    tower1.y1_state.move('Si')
+    with pytest.raises(ValueError):
+        tower1.get_material()
+    tower1.chi1_state.move('Si')
+    assert tower1.get_material() == 'Si'
+
+
+def test_tower1_cache_invalidation(fake_tower1):
+    tower1 = fake_tower1
+    signal = tower1.diamond_reflection
+    get = signal.get
+
+    def get_then_update(*args, **kwargs):
+        value = get(*args, **kwargs)
+        signal.sim_put((2, 2, 0))
+        return value
+
+    # an update that arrives during the read is not hidden by the cache
+    with patch.object(signal, 'get', get_then_update):
+        assert tower1._get_cached('diamond_reflection') == (1, 1, 1)
+    assert tower1._get_cached('diamond_reflection') == (2, 2, 0)
+    # connection changes come in as metadata updates
+    signal._run_subs(sub_type=signal.SUB_META, connected=False)
+    assert 'diamond_reflection' not in tower1._cpt_cache
+
+
 def test_get_reflection_tower1(fake_tower1):
     tower1 = fake_tower1
     # defalts to (1, 1, 1), see fake_tower1 setup
@@ -400,6 +534,20 @@ def test_get_material_lodcm(fake_lodcm):
         lom.get_material()
 
 
+def test_get_configuration_lodcm(fake_lodcm):
+    lom = fake_lodcm
+    assert lom._get_configuration() == ('C', (1, 1, 1))
+    # the reflections of the two towers do not match
+    lom.tower2.diamond_reflection.sim_put((2, 2, 0))
+    with pytest.raises(ValueError):
+        lom._get_configuration()
+    with patch('pcdsdevices.lodcm.LODCM.get_energy') as get_energy:
+        status = lom.status()
+        assert not get_energy.called
+    assert 'Current Configuration: Diamond (Unknown)' in status
+    assert 'Photon Energy: Unknown [keV]' in status
+
+
 def test_calc_geometry_c(fake_energy_c):
     energy = fake_energy_c
     logger.info('Testing with C, (1, 1, 1)')
@@ -446,6 +594,15 @@ def test_calc_geometry_si(fake_energy_si):
         assert np.isclose(z, 139.21560118646275)
 
 
+def test_calc_geometry_list_reflection(fake_energy_si):
+    energy = fake_energy_si
+    # geometry is cached, so the reflection has to be usable as a key
+    th, z = energy.calc_geometry(energy=10, reflection=[1, 1, 1])
+    assert np.isclose(th, 11.402710639982848)
+    assert np.isclose(z, 713.4828146545175)
+    assert energy.calc_geometry(energy=10, reflection=(1, 1, 1)) == (th, z)
+
+
 def test_get_energy_c(fake_energy_c):
     energy = fake_energy_c
     energy.th1C.user_offset.sim_put(-23)
@@ -472,6 +629,31 @@ def test_get_energy_si(fake_energy_si):
         assert np.isclose(res, 5.059840436879476)
 
 
+def test_get_energy_list_reflection(fake_energy_si):
+    energy = fake_energy_si
+    energy.th1Si.user_offset.sim_put(-23)
+    # d-spacing is cached, so the reflection has to be usable as a key
+    res = energy.get_energy(reflection=[1, 1, 1])
+    assert np.isclose(res, 5.059840436879476)
+    assert np.isclose(energy.get_energy(reflection=(1, 1, 1)), res)
+
+
+def test_get_both_tower_energies(fake_energy_si, fake_lodcm):
+    energy = fake_energy_si
+    energy.th1Si.user_offset.sim_put(-23)
+    energy.th2Si.user_offset.sim_put(-30)
+    e1, e2 = energy.get_both_tower_energies(reflection=(1, 1, 1))
+    assert np.isclose(e1, 5.059840436879476)
+    assert np.isclose(e1, energy.get_energy(reflection=(1, 1, 1)))
+    assert e2 < e1
+    # material and reflection are read from the towers, C (1, 1, 1) here
+    fake_lodcm.energy_c.th1C.move(23, wait=True)
+    fake_lodcm.energy_c.th2C.move(23, wait=True)
+    e1, e2 = fake_lodcm.get_both_tower_energies()
+    assert np.isclose(e1, fake_lodcm.get_energy())
+    assert np.isclose(e1, e2)
+
+
 def test_forward_si(fake_energy_si):
     energy = fake_energy_si
 